@@ -5,6 +5,8 @@ Configured for Brave Browser
 Alternates between 25-minute work sessions and 5-minute breaks
 """
 
+import functools
+import json
 import time
 import sys
 import os
@@ -15,63 +17,181 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException, SessionNotCreatedException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 
+
+def _brave_candidate_paths(system):
+    """List the usual Brave install locations for the given platform"""
+    possible_paths = []
+    
+    if system == "Windows":
+        possible_paths = [
+            r"C:\Program Files\BraveSoftware\Brave-Browser\Application\brave.exe",
+            r"C:\Program Files (x86)\BraveSoftware\Brave-Browser\Application\brave.exe",
+            os.path.expandvars(r"%LOCALAPPDATA%\BraveSoftware\Brave-Browser\Application\brave.exe"),
+            os.path.expandvars(r"%PROGRAMFILES%\BraveSoftware\Brave-Browser\Application\brave.exe"),
+            os.path.expandvars(r"%PROGRAMFILES(X86)%\BraveSoftware\Brave-Browser\Application\brave.exe"),
+            os.path.join(os.path.expanduser("~"), r"AppData\Local\BraveSoftware\Brave-Browser\Application\brave.exe"),
+        ]
+    elif system == "Darwin":  # macOS
+        possible_paths = [
+            "/Applications/Brave Browser.app/Contents/MacOS/Brave Browser",
+            os.path.expanduser("~/Applications/Brave Browser.app/Contents/MacOS/Brave Browser"),
+        ]
+    else:  # Linux
+        possible_paths = [
+            "/usr/bin/brave-browser",
+            "/usr/bin/brave",
+            "/usr/local/bin/brave-browser",
+            "/usr/local/bin/brave",
+            "/opt/brave.com/brave/brave-browser",
+            "/opt/brave.com/brave/brave",
+            "/snap/bin/brave",
+            os.path.expanduser("~/.local/bin/brave"),
+            os.path.expanduser("~/.local/bin/brave-browser"),
+        ]
+    
+    return possible_paths
+
+
+def _env_flag(name):
+    """Return True when an environment variable is set to anything but empty or 0"""
+    return os.getenv(name, "") not in ("", "0")
+
+
+@functools.lru_cache(maxsize=1)
+def _find_brave(system):
+    """Return the first existing Brave path, cached so repeat lookups skip the filesystem"""
+    for path in _brave_candidate_paths(system):
+        if os.path.exists(path):
+            return path
+    return None
+
+
 class PomodoroAutomation:
     """Main class for Pomodoro timer automation using Brave Browser"""
     
+    # Page scripts are kept as constants; values are passed as script arguments
+    _SET_TIMER_JS = """
+        // Set timer values
+        var minutes = arguments[0];
+        var hourInput = document.getElementById('hours') || document.querySelector('input[name="hours"]');
+        var minuteInput = document.getElementById('minutes') || document.querySelector('input[name="minutes"]');
+        var secondInput = document.getElementById('seconds') || document.querySelector('input[name="seconds"]');
+        
+        if (hourInput) {
+            hourInput.value = '0';
+            hourInput.dispatchEvent(new Event('change', { bubbles: true }));
+        }
+        
+        if (minuteInput) {
+            minuteInput.value = String(minutes);
+            minuteInput.dispatchEvent(new Event('change', { bubbles: true }));
+        }
+        
+        if (secondInput) {
+            secondInput.value = '0';
+            secondInput.dispatchEvent(new Event('change', { bubbles: true }));
+        }
+        
+        // Alternative method for vClock
+        if (typeof setTimer === 'function') {
+            setTimer(0, minutes, 0);
+            return true;
+        }
+        
+        return !!minuteInput;
+    """
+    
+    _START_TIMER_JS = """
+        // Find and click start button
+        var startButton = document.querySelector('button:not([disabled])') || 
+                         document.querySelector('input[type="button"]:not([disabled])');
+        
+        // Look for button with "Start" text
+        var buttons = document.querySelectorAll('button, input[type="button"], input[type="submit"]');
+        for (var i = 0; i < buttons.length; i++) {
+            var btn = buttons[i];
+            if ((btn.textContent && btn.textContent.toLowerCase().includes('start')) ||
+                (btn.value && btn.value.toLowerCase().includes('start'))) {
+                if (!btn.disabled) {
+                    btn.click();
+                    return true;
+                }
+            }
+        }
+        
+        // Alternative: trigger start function directly if available
+        if (typeof startTimer === 'function') {
+            startTimer();
+            return true;
+        }
+        if (typeof start === 'function') {
+            start();
+            return true;
+        }
+        
+        return false;
+    """
+    
+    _RESET_TIMER_JS = """
+        // Use vClock's own reset if available, otherwise click its reset button
+        var reset = false;
+        if (typeof resetTimer === 'function') {
+            resetTimer();
+            reset = true;
+        } else {
+            var buttons = document.querySelectorAll('button, input[type="button"]');
+            for (var i = 0; i < buttons.length; i++) {
+                var btn = buttons[i];
+                var text = (btn.textContent || btn.value || '').toLowerCase();
+                if (text.includes('reset') && !btn.disabled) {
+                    btn.click();
+                    reset = true;
+                    break;
+                }
+            }
+        }
+        
+        if (reset) {
+            var inputs = document.querySelectorAll('input[name="hours"], input[name="minutes"], input[name="seconds"]');
+            inputs.forEach(function(input) {
+                input.value = '0';
+                input.dispatchEvent(new Event('change', { bubbles: true }));
+            });
+        }
+        
+        return reset;
+    """
+    
     def __init__(self):
         self.driver = None
-        self.work_tab = None
-        self.break_tab = None
         self.work_duration = 25  # minutes
         self.break_duration = 5  # minutes
+        self.max_retries = 3  # consecutive failed cycles before giving up
         self.timer_url = "https://vclock.com/timer/"
         self.browser_type = "Brave"
+        self.driver_cache_file = os.path.expanduser("~/.pomodoro_chromedriver")
+        self.headless = _env_flag("POMODORO_HEADLESS")
+        self._ts_epoch = 0
+        self._ts_str = ""
+        self.profile = _env_flag("POMODORO_PROFILE")
+        self.trace_file = "pomodoro_trace.json"
         
     def find_brave_path(self):
         """Find Brave browser installation path"""
         system = platform.system()
+        path = _find_brave(system)
         
-        possible_paths = []
-        
-        if system == "Windows":
-            possible_paths = [
-                r"C:\Program Files\BraveSoftware\Brave-Browser\Application\brave.exe",
-                r"C:\Program Files (x86)\BraveSoftware\Brave-Browser\Application\brave.exe",
-                os.path.expandvars(r"%LOCALAPPDATA%\BraveSoftware\Brave-Browser\Application\brave.exe"),
-                os.path.expandvars(r"%PROGRAMFILES%\BraveSoftware\Brave-Browser\Application\brave.exe"),
-                os.path.expandvars(r"%PROGRAMFILES(X86)%\BraveSoftware\Brave-Browser\Application\brave.exe"),
-                os.path.join(os.path.expanduser("~"), r"AppData\Local\BraveSoftware\Brave-Browser\Application\brave.exe"),
-            ]
-        elif system == "Darwin":  # macOS
-            possible_paths = [
-                "/Applications/Brave Browser.app/Contents/MacOS/Brave Browser",
-                os.path.expanduser("~/Applications/Brave Browser.app/Contents/MacOS/Brave Browser"),
-            ]
-        else:  # Linux
-            possible_paths = [
-                "/usr/bin/brave-browser",
-                "/usr/bin/brave",
-                "/usr/local/bin/brave-browser",
-                "/usr/local/bin/brave",
-                "/opt/brave.com/brave/brave-browser",
-                "/opt/brave.com/brave/brave",
-                "/snap/bin/brave",
-                os.path.expanduser("~/.local/bin/brave"),
-                os.path.expanduser("~/.local/bin/brave-browser"),
-            ]
-        
-        # Check each possible path
-        for path in possible_paths:
-            if os.path.exists(path):
-                print(f"[{self.get_timestamp()}] Found Brave at: {path}")
-                return path
+        if path:
+            print(f"[{self.get_timestamp()}] Found Brave at: {path}")
+            return path
         
         # If not found, print helpful message
+        possible_paths = _brave_candidate_paths(system)
         print(f"[{self.get_timestamp()}] Brave browser not found in standard locations")
         print(f"[{self.get_timestamp()}] Searched paths:")
         for path in possible_paths[:3]:  # Show first 3 paths as examples
@@ -79,6 +199,29 @@ class PomodoroAutomation:
         
         return None
     
+    def get_chromedriver_path(self, use_cache=True):
+        """Return a cached ChromeDriver path, installing it only when needed"""
+        if use_cache:
+            try:
+                with open(self.driver_cache_file) as f:
+                    cached_path = f.read().strip()
+                if cached_path and os.path.exists(cached_path):
+                    print(f"[{self.get_timestamp()}] Using cached ChromeDriver: {cached_path}")
+                    return cached_path
+            except OSError:
+                pass
+        
+        print(f"[{self.get_timestamp()}] Downloading/updating ChromeDriver...")
+        driver_path = ChromeDriverManager().install()
+        
+        try:
+            with open(self.driver_cache_file, "w") as f:
+                f.write(driver_path)
+        except OSError:
+            pass  # Caching is only an optimization
+        
+        return driver_path
+    
     def setup_brave_browser(self):
         """Setup Brave browser with Selenium"""
         try:
@@ -112,20 +255,51 @@ class PomodoroAutomation:
             chrome_options.add_argument("--disable-features=VizDisplayCompositor")
             chrome_options.add_argument("--log-level=3")  # Suppress console messages
             
+            # Headless mode hides and mutes the vClock alarm, so it is opt-in (set POMODORO_HEADLESS=1)
+            if self.headless:
+                chrome_options.add_argument("--headless=new")
+                chrome_options.add_argument("--mute-audio")
+            else:
+                chrome_options.add_argument("--start-maximized")
+            
+            # Skip images and background features the timer page does not need
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_argument("--disable-extensions")
+            chrome_options.add_argument("--disable-background-networking")
+            chrome_options.add_argument("--disable-sync")
+            chrome_options.add_argument("--disable-translate")
+            chrome_options.add_argument("--metrics-recording-only")
+            chrome_options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2,
+            })
+            if platform.system() == "Linux" and os.getenv("CI"):
+                chrome_options.add_argument("--single-process")
+            
+            # Optional performance trace of the tab setup (set POMODORO_PROFILE=1)
+            if self.profile:
+                chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+                chrome_options.add_experimental_option("perfLoggingPrefs", {
+                    "enableNetwork": False,
+                    "enablePage": False,
+                    "traceCategories": "devtools.timeline,v8.execute,blink.user_timing",
+                })
+            
             # Disable Brave-specific features that might interfere
             chrome_options.add_argument("--disable-brave-update")
             chrome_options.add_argument("--disable-brave-rewards")
             chrome_options.add_argument("--disable-brave-wallet")
             
             # Create Chrome driver (works with Brave)
-            print(f"[{self.get_timestamp()}] Downloading/updating ChromeDriver...")
-            service = Service(ChromeDriverManager().install())
-            
             print(f"[{self.get_timestamp()}] Starting Brave browser...")
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            
-            # Maximize window
-            self.driver.maximize_window()
+            try:
+                service = Service(self.get_chromedriver_path())
+                self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            except SessionNotCreatedException:
+                # The cached driver no longer matches the browser (e.g. after an update)
+                print(f"[{self.get_timestamp()}] ChromeDriver does not match the browser, reinstalling...")
+                service = Service(self.get_chromedriver_path(use_cache=False))
+                self.driver = webdriver.Chrome(service=service, options=chrome_options)
             
             print(f"[{self.get_timestamp()}] Brave browser initialized successfully!")
             return True
@@ -143,127 +317,52 @@ class PomodoroAutomation:
         return self.setup_brave_browser()
     
     def setup_tabs(self):
-        """Create and setup two tabs for work and break timers"""
+        """Load the timer page in a single tab shared by work and break sessions"""
         try:
-            print(f"[{self.get_timestamp()}] Setting up timer tabs...")
-            
-            # Tab A - Work Timer
-            print(f"[{self.get_timestamp()}] Loading work timer tab...")
+            print(f"[{self.get_timestamp()}] Loading timer tab...")
             self.driver.get(self.timer_url)
-            time.sleep(5)  # Give time for page to fully load
-            self.work_tab = self.driver.current_window_handle
-            print(f"[{self.get_timestamp()}] Work timer tab created")
-            
-            # Tab B - Break Timer
-            print(f"[{self.get_timestamp()}] Creating break timer tab...")
-            self.driver.execute_script("window.open('');")
-            time.sleep(1)
-            
-            # Switch to new tab
-            all_tabs = self.driver.window_handles
-            for tab in all_tabs:
-                if tab != self.work_tab:
-                    self.break_tab = tab
-                    break
-            
-            self.driver.switch_to.window(self.break_tab)
-            print(f"[{self.get_timestamp()}] Loading break timer tab...")
-            self.driver.get(self.timer_url)
-            time.sleep(5)  # Give time for page to fully load
-            print(f"[{self.get_timestamp()}] Break timer tab created")
-            
-            # Switch back to work tab
-            self.driver.switch_to.window(self.work_tab)
+            self.wait_for_timer_page()
             
-            print(f"[{self.get_timestamp()}] Both timer tabs ready!")
+            print(f"[{self.get_timestamp()}] Timer tab ready!")
             return True
             
         except Exception as e:
-            print(f"[{self.get_timestamp()}] Error setting up tabs: {e}")
+            print(f"[{self.get_timestamp()}] Error setting up timer tab: {e}")
             return False
     
-    def get_timestamp(self):
-        """Get current timestamp for logging"""
-        return datetime.now().strftime("%H:%M:%S")
-    
-    def switch_tab(self, tab_handle):
-        """Switch to specified browser tab"""
+    def wait_for_timer_page(self):
+        """Wait until the timer inputs are present instead of sleeping a fixed time"""
         try:
-            self.driver.switch_to.window(tab_handle)
-            time.sleep(1.5)  # Small delay to ensure smooth switching
-            return True
-        except Exception as e:
-            print(f"[{self.get_timestamp()}] Error switching tabs: {e}")
-            return False
+            WebDriverWait(self.driver, 8).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "input#minutes, input[name='minutes']"))
+            )
+        except TimeoutException:
+            print(f"[{self.get_timestamp()}] Timer inputs not found yet, continuing anyway")
+    
+    def get_timestamp(self):
+        """Get current timestamp for logging (reformatted at most once per second)"""
+        now = int(time.time())
+        if now != self._ts_epoch:
+            self._ts_epoch = now
+            self._ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+        return self._ts_str
     
     def set_timer_duration(self, minutes):
         """Set timer duration on vClock.com"""
         try:
-            # Wait for page to be ready
-            time.sleep(2)
-            
             # Use JavaScript to set timer values directly
-            script = f"""
-                // Set timer values
-                var hourInput = document.getElementById('hours') || document.querySelector('input[name="hours"]');
-                var minuteInput = document.getElementById('minutes') || document.querySelector('input[name="minutes"]');
-                var secondInput = document.getElementById('seconds') || document.querySelector('input[name="seconds"]');
-                
-                if (hourInput) {{
-                    hourInput.value = '0';
-                    hourInput.dispatchEvent(new Event('change', {{ bubbles: true }}));
-                }}
-                
-                if (minuteInput) {{
-                    minuteInput.value = '{minutes}';
-                    minuteInput.dispatchEvent(new Event('change', {{ bubbles: true }}));
-                }}
-                
-                if (secondInput) {{
-                    secondInput.value = '0';
-                    secondInput.dispatchEvent(new Event('change', {{ bubbles: true }}));
-                }}
-                
-                // Alternative method for vClock
-                if (typeof setTimer === 'function') {{
-                    setTimer(0, {minutes}, 0);
-                }}
-            """
+            result = self.driver.execute_script(self._SET_TIMER_JS, minutes)
             
-            self.driver.execute_script(script)
-            time.sleep(1)
+            if not result:
+                print(f"[{self.get_timestamp()}] Could not find timer inputs on the page")
+                return False
             
             print(f"[{self.get_timestamp()}] Timer set to {minutes} minutes")
             return True
             
         except Exception as e:
             print(f"[{self.get_timestamp()}] Error setting timer duration: {e}")
-            
-            # Fallback method: Try using Selenium selectors
-            try:
-                wait = WebDriverWait(self.driver, 5)
-                
-                # Try to find input fields
-                inputs = self.driver.find_elements(By.TAG_NAME, "input")
-                for inp in inputs:
-                    inp_id = inp.get_attribute("id") or ""
-                    inp_name = inp.get_attribute("name") or ""
-                    
-                    if "hour" in inp_id.lower() or "hour" in inp_name.lower():
-                        inp.clear()
-                        inp.send_keys("0")
-                    elif "minute" in inp_id.lower() or "minute" in inp_name.lower():
-                        inp.clear()
-                        inp.send_keys(str(minutes))
-                    elif "second" in inp_id.lower() or "second" in inp_name.lower():
-                        inp.clear()
-                        inp.send_keys("0")
-                
-                time.sleep(1)
-                return True
-                
-            except:
-                return False
+            return False
     
     def start_timer(self):
         """Start the timer on current tab"""
@@ -271,38 +370,7 @@ class PomodoroAutomation:
             time.sleep(1)
             
             # JavaScript to click start button
-            script = """
-                // Find and click start button
-                var startButton = document.querySelector('button:not([disabled])') || 
-                                 document.querySelector('input[type="button"]:not([disabled])');
-                
-                // Look for button with "Start" text
-                var buttons = document.querySelectorAll('button, input[type="button"], input[type="submit"]');
-                for (var i = 0; i < buttons.length; i++) {
-                    var btn = buttons[i];
-                    if ((btn.textContent && btn.textContent.toLowerCase().includes('start')) ||
-                        (btn.value && btn.value.toLowerCase().includes('start'))) {
-                        if (!btn.disabled) {
-                            btn.click();
-                            return true;
-                        }
-                    }
-                }
-                
-                // Alternative: trigger start function directly if available
-                if (typeof startTimer === 'function') {
-                    startTimer();
-                    return true;
-                }
-                if (typeof start === 'function') {
-                    start();
-                    return true;
-                }
-                
-                return false;
-            """
-            
-            result = self.driver.execute_script(script)
+            result = self.driver.execute_script(self._START_TIMER_JS)
             
             if result:
                 print(f"[{self.get_timestamp()}] Timer started")
@@ -336,31 +404,31 @@ class PomodoroAutomation:
     def stop_timer(self):
         """Stop/Reset the timer on current tab"""
         try:
-            # Refresh the page to reset timer
+            # Reset the timer widget in place instead of reloading the page
+            if self.driver.execute_script(self._RESET_TIMER_JS):
+                time.sleep(0.3)
+                return True
+            
+            # No reset control found, so reload to clear the countdown and alarm state
             self.driver.refresh()
-            time.sleep(4)
+            self.wait_for_timer_page()
             return True
             
         except Exception as e:
             print(f"[{self.get_timestamp()}] Error stopping timer: {e}")
             return False
     
-    def start_work_timer(self):
-        """Start a 25-minute work session"""
-        print(f"\n[{self.get_timestamp()}] ====== WORK SESSION STARTING ======")
+    def _run_session(self, label, duration):
+        """Run one work or break session of the given length in minutes"""
+        print(f"\n[{self.get_timestamp()}] ====== {label} SESSION STARTING ======")
         
-        # Switch to work tab
-        if not self.switch_tab(self.work_tab):
+        # Reset timer first (only fails when the browser itself is unusable)
+        if not self.stop_timer():
             return False
-        
-        time.sleep(2)
-        
-        # Reset timer first
-        self.stop_timer()
         time.sleep(2)
         
         # Set duration
-        if not self.set_timer_duration(self.work_duration):
+        if not self.set_timer_duration(duration):
             print(f"[{self.get_timestamp()}] Warning: Could not set timer duration, using default")
         
         time.sleep(1)
@@ -369,55 +437,26 @@ class PomodoroAutomation:
         if not self.start_timer():
             print(f"[{self.get_timestamp()}] Warning: Could not start timer automatically")
         
-        print(f"[{self.get_timestamp()}] Work session active ({self.work_duration} minutes)")
-        print(f"[{self.get_timestamp()}] Expected completion: {self.get_completion_time(self.work_duration)}")
+        print(f"[{self.get_timestamp()}] {label.capitalize()} session active ({duration} minutes)")
+        print(f"[{self.get_timestamp()}] Expected completion: {self.get_completion_time(duration)}")
         
         # Progress indicator
-        print(f"[{self.get_timestamp()}] Progress: ", end="")
-        for i in range(self.work_duration):
-            print(".", end="", flush=True)
-            time.sleep(60)  # Wait 1 minute
-        print(" Done!")
+        self._wait_with_progress(duration)
         
-        print(f"[{self.get_timestamp()}] Work session completed!")
+        print(f"[{self.get_timestamp()}] {label.capitalize()} session completed!")
         return True
     
-    def start_break_timer(self):
-        """Start a 5-minute break session"""
-        print(f"\n[{self.get_timestamp()}] ====== BREAK SESSION STARTING ======")
-        
-        # Switch to break tab
-        if not self.switch_tab(self.break_tab):
-            return False
-        
-        time.sleep(2)
-        
-        # Reset timer first
-        self.stop_timer()
-        time.sleep(2)
-        
-        # Set duration
-        if not self.set_timer_duration(self.break_duration):
-            print(f"[{self.get_timestamp()}] Warning: Could not set timer duration, using default")
-        
-        time.sleep(1)
-        
-        # Start timer
-        if not self.start_timer():
-            print(f"[{self.get_timestamp()}] Warning: Could not start timer automatically")
-        
-        print(f"[{self.get_timestamp()}] Break session active ({self.break_duration} minutes)")
-        print(f"[{self.get_timestamp()}] Expected completion: {self.get_completion_time(self.break_duration)}")
-        
-        # Progress indicator
+    def _wait_with_progress(self, minutes):
+        """Wait for the session to finish, printing a dot every minute"""
         print(f"[{self.get_timestamp()}] Progress: ", end="")
-        for i in range(self.break_duration):
+        deadline = time.monotonic() + minutes * 60
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(60, remaining))
             print(".", end="", flush=True)
-            time.sleep(60)  # Wait 1 minute
         print(" Done!")
-        
-        print(f"[{self.get_timestamp()}] Break session completed!")
-        return True
     
     def get_completion_time(self, minutes):
         """Calculate and return expected completion time"""
@@ -428,6 +467,7 @@ class PomodoroAutomation:
     def main_loop(self):
         """Main Pomodoro loop - alternates between work and break"""
         session_count = 0
+        failures = 0
         
         print(f"\n[{self.get_timestamp()}] Starting Pomodoro automation loop...")
         print(f"[{self.get_timestamp()}] Browser: {self.browser_type}")
@@ -435,25 +475,30 @@ class PomodoroAutomation:
         print(f"[{self.get_timestamp()}] Press Ctrl+C to stop\n")
         
         try:
-            while True:
-                session_count += 1
+            while failures <= self.max_retries:
                 print(f"\n{'='*60}")
-                print(f"[{self.get_timestamp()}] POMODORO CYCLE #{session_count}")
+                print(f"[{self.get_timestamp()}] POMODORO CYCLE #{session_count + 1}")
                 print(f"{'='*60}")
                 
                 # Work session
-                if not self.start_work_timer():
+                if not self._run_session("WORK", self.work_duration):
+                    failures += 1
                     print(f"[{self.get_timestamp()}] Error in work timer, retrying...")
-                    time.sleep(5)
+                    time.sleep(5 * failures)
                     continue
                 
                 # Break session
-                if not self.start_break_timer():
+                if not self._run_session("BREAK", self.break_duration):
+                    failures += 1
                     print(f"[{self.get_timestamp()}] Error in break timer, retrying...")
-                    time.sleep(5)
+                    time.sleep(5 * failures)
                     continue
                 
+                failures = 0
+                session_count += 1
                 print(f"\n[{self.get_timestamp()}] ✓ Cycle #{session_count} completed successfully!")
+            
+            print(f"[{self.get_timestamp()}] Giving up after {self.max_retries} retries in a row")
                 
         except KeyboardInterrupt:
             print(f"\n\n[{self.get_timestamp()}] Pomodoro automation stopped by user")
@@ -465,6 +510,18 @@ class PomodoroAutomation:
         finally:
             self.cleanup()
     
+    def save_performance_trace(self):
+        """Write collected trace events to a file that chrome://tracing can open"""
+        trace_events = []
+        for entry in self.driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            if message.get("method") == "Tracing.dataCollected":
+                trace_events.append(message["params"])
+        
+        with open(self.trace_file, "w") as f:
+            json.dump({"traceEvents": trace_events}, f)
+        print(f"[{self.get_timestamp()}] Performance trace saved to {self.trace_file} ({len(trace_events)} events)")
+    
     def cleanup(self):
         """Clean up resources and close browser"""
         try:
@@ -489,12 +546,19 @@ class PomodoroAutomation:
             print("2. The browser path in the script matches your installation")
             sys.exit(1)
         
-        # Setup tabs
+        # Setup timer tab
         if not self.setup_tabs():
-            print("[ERROR] Failed to setup timer tabs.")
+            print("[ERROR] Failed to setup timer tab.")
             self.cleanup()
             sys.exit(1)
         
+        # Save the setup trace now rather than buffering events for the whole run
+        if self.profile:
+            try:
+                self.save_performance_trace()
+            except Exception as e:
+                print(f"[{self.get_timestamp()}] Could not save performance trace: {e}")
+        
         # Start main loop
         self.main_loop()
 
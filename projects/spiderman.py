@@ -1,3 +1,4 @@
+import math
 import turtle
 
 # ----------------- CONFIGURATION -----------------
@@ -8,13 +9,30 @@ BLUE_COLOR = "blue"
 MAIN_PEN_SIZE = 16
 DETAIL_PEN_SIZE = 4
 
-# ----------------- HELPER FUNCTION -----------------
+# Stick-figure body as polylines: torso, right arm, left arm, right leg, left leg
+BODY_STROKES = [
+    [(0, 100), (0, -80)],
+    [(0, 50), (100, 20), (150, 70)],
+    [(0, 50), (-80, 80), (-140, 50)],
+    [(0, -80), (60, -180), (50, -250)],
+    [(0, -80), (-70, -170), (-60, -240)],
+]
+
+# ----------------- HELPER FUNCTIONS -----------------
 def go_to(t, x, y):
     """Moves the turtle to a specific coordinate without drawing."""
     t.penup()
     t.goto(x, y)
     t.pendown()
 
+def fill_polygon(t, points):
+    """Draws a filled polygon through the given points, starting at the first one."""
+    go_to(t, *points[0])
+    t.begin_fill()
+    for point in points[1:]:
+        t.goto(point)
+    t.end_fill()
+
 # ----------------- DRAWING FUNCTIONS -----------------
 
 def draw_body_and_limbs(t):
@@ -22,29 +40,11 @@ def draw_body_and_limbs(t):
     t.color(LINE_COLOR)
     t.pensize(MAIN_PEN_SIZE)
 
-    # Torso
-    go_to(t, 0, 100)
-    t.goto(0, -80)
-
-    # Right Arm (viewer's left)
-    go_to(t, 0, 50)
-    t.goto(100, 20)
-    t.goto(150, 70)
-
-    # Left Arm (viewer's right)
-    go_to(t, 0, 50)
-    t.goto(-80, 80)
-    t.goto(-140, 50)
-
-    # Right Leg (viewer's left)
-    go_to(t, 0, -80)
-    t.goto(60, -180)
-    t.goto(50, -250)
-
-    # Left Leg (viewer's right)
-    go_to(t, 0, -80)
-    t.goto(-70, -170)
-    t.goto(-60, -240)
+    # Each stroke is one continuous line, so the pen only lifts between strokes
+    for stroke in BODY_STROKES:
+        go_to(t, *stroke[0])
+        for point in stroke[1:]:
+            t.goto(point)
 
 def draw_head_and_eyes(t):
     """Draws the head and eyes on top of the body."""
@@ -61,22 +61,10 @@ def draw_head_and_eyes(t):
     t.color(LINE_COLOR, EYE_COLOR)
     
     # Left Eye
-    go_to(t, -15, 150)
-    t.begin_fill()
-    t.goto(-55, 120)
-    t.goto(-50, 90)
-    t.goto(-15, 110)
-    t.goto(-15, 150)
-    t.end_fill()
+    fill_polygon(t, [(-15, 150), (-55, 120), (-50, 90), (-15, 110), (-15, 150)])
 
     # Right Eye
-    go_to(t, 15, 150)
-    t.begin_fill()
-    t.goto(55, 120)
-    t.goto(50, 90)
-    t.goto(15, 110)
-    t.goto(15, 150)
-    t.end_fill()
+    fill_polygon(t, [(15, 150), (55, 120), (50, 90), (15, 110), (15, 150)])
 
 def draw_webbed_accessory(t, width, height):
     """A reusable function to draw a filled blue box with a web pattern."""
@@ -97,24 +85,23 @@ def draw_webbed_accessory(t, width, height):
     # Add the black web pattern
     t.color(LINE_COLOR)
     t.pensize(DETAIL_PEN_SIZE)
-    
-    # Vertical lines
-    for i in range(1, 3):
-        go_to(t, start_pos[0], start_pos[1])
-        t.setheading(start_heading)
-        t.forward(i * width / 3)
-        t.right(90)
-        t.pendown()
-        t.forward(height)
-    
-    # Horizontal line
-    go_to(t, start_pos[0], start_pos[1])
-    t.setheading(start_heading)
-    t.right(90)
-    t.forward(height / 2)
-    t.left(90)
-    t.pendown()
-    t.forward(width)
+
+    # Work out the web line endpoints directly instead of re-walking the box.
+    # dx runs along the starting heading, dy to its left (negative is "down").
+    cos_h = math.cos(math.radians(start_heading))
+    sin_h = math.sin(math.radians(start_heading))
+
+    def local(dx, dy):
+        return (start_pos[0] + dx * cos_h - dy * sin_h,
+                start_pos[1] + dx * sin_h + dy * cos_h)
+
+    # Two vertical lines and one horizontal line
+    web_lines = [(local(i * width / 3, 0), local(i * width / 3, -height)) for i in (1, 2)]
+    web_lines.append((local(0, -height / 2), local(width, -height / 2)))
+
+    for start, end in web_lines:
+        go_to(t, *start)
+        t.goto(end)
 
 def draw_costume_details(t):
     """Draws the backpack, gloves, and boots."""
@@ -149,9 +136,12 @@ def main():
     screen = turtle.Screen()
     screen.bgcolor(BG_COLOR)
     screen.title("Cartoon Spider-Man")
+    # Turn off animation so the whole drawing is painted in a single update
+    screen.tracer(0, 0)
     
-    spidey = turtle.Turtle()
-    spidey.speed(0)
+    # No undo is needed, so skip recording every drawing step
+    spidey = turtle.RawTurtle(screen)
+    spidey.setundobuffer(None)
     spidey.hideturtle()
 
     # The drawing order is critical for correct layering.
@@ -164,6 +154,7 @@ def main():
     # 3. Draw the head and eyes last so they are on the very top layer.
     draw_head_and_eyes(spidey)
     
+    screen.update()
     screen.exitonclick()
 
 if __name__ == "__main__":